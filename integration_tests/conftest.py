@@ -1,47 +1,121 @@
+import concurrent.futures
 import os
 import pytest
-import shutil
+import pytest_asyncio
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from dotenv import load_dotenv
 from langflow_client import LangflowClient
 
-# Load environment variables from .env file
-load_dotenv()
+# Test environment configuration, read once per pytest process in pytest_configure
+LANGFLOW_ENV_KEY = pytest.StashKey[dict]()
 
-# Test environment configuration
-LANGFLOW_SERVER_URL = os.getenv("LANGFLOW_SERVER_URL")
-LANGFLOW_API_KEY = os.getenv("LANGFLOW_API_KEY")
-TEST_FLOW_ID = os.getenv("LANGFLOW_FLOW_ID")
+def pytest_configure(config):
+    """Load and validate the test environment from the .env file."""
+    load_dotenv()
+    env = {
+        "server_url": os.getenv("LANGFLOW_SERVER_URL"),
+        "api_key": os.getenv("LANGFLOW_API_KEY"),
+        "flow_id": os.getenv("LANGFLOW_FLOW_ID"),
+    }
 
-# Validate required environment variables
-if not all([LANGFLOW_SERVER_URL, LANGFLOW_API_KEY, TEST_FLOW_ID]):
-    raise ValueError(
-        "Missing required environment variables. Please ensure LANGFLOW_SERVER_URL, "
-        "LANGFLOW_API_KEY, and LANGFLOW_FLOW_ID are set in your .env file."
-    )
+    # Validate required environment variables
+    if not all(env.values()):
+        raise ValueError(
+            "Missing required environment variables. Please ensure LANGFLOW_SERVER_URL, "
+            "LANGFLOW_API_KEY, and LANGFLOW_FLOW_ID are set in your .env file."
+        )
+    config.stash[LANGFLOW_ENV_KEY] = env
+
+@pytest.fixture(scope="session")
+def langflow_env(pytestconfig):
+    """Test environment configuration loaded in pytest_configure."""
+    return pytestconfig.stash[LANGFLOW_ENV_KEY]
 
 @pytest.fixture(scope="session")
-def client():
+def client(langflow_env):
     """Create a LangflowClient instance configured for testing."""
-    return LangflowClient({
-        "base_url": LANGFLOW_SERVER_URL,
-        "api_key": LANGFLOW_API_KEY
+    client = LangflowClient({
+        "base_url": langflow_env["server_url"],
+        "api_key": langflow_env["api_key"],
+        # Concurrent tests multiplex over one HTTP/2 connection
+        "http2": True,
+    })
+    # Warm-up request so the pooled connection is open before any test runs
+    client.files.list()
+    yield client
+    client.close()
+
+@pytest.fixture(scope="session")
+def bad_client():
+    """A client pointed at a closed local port, so requests fail immediately."""
+    client = LangflowClient({
+        "base_url": "http://127.0.0.1:1",
+        "api_key": "invalid",
+        "timeout": 0.5,
+        "max_retries": 0,
     })
+    yield client
+    client.close()
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client(client):
+    """The client's httpx.AsyncClient, kept warm across async tests on the session loop."""
+    yield client.async_session
+    await client.aclose()
 
 @pytest.fixture(scope="session")
-def test_flow(client):
+def test_flow(client, langflow_env):
     """Get the test flow that echoes back the input."""
-    return client.flow(TEST_FLOW_ID)
+    return client.flow(langflow_env["flow_id"])
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def shared_executor():
+    """Thread pool shared by the concurrency tests."""
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) + 4)
+    )
+    yield executor
+    executor.shutdown(wait=True)
+
+# One directory per test session, removed in pytest_sessionfinish
+TEST_FILES_DIR = Path(__file__).parent / "test_files" / uuid.uuid4().hex[:8]
+
+def pytest_sessionfinish(session, exitstatus):
+    """Remove the test files created during this session."""
+    # The directory is flat, so one scandir pass and no per-entry stat is enough
+    try:
+        with os.scandir(TEST_FILES_DIR) as entries:
+            for entry in entries:
+                os.unlink(entry.path)
+        TEST_FILES_DIR.rmdir()
+    except FileNotFoundError:
+        return  # No file fixture was used
+    try:
+        TEST_FILES_DIR.parent.rmdir()
+    except OSError:
+        pass  # Another session still uses it
+
+@pytest.fixture(scope="session")
 def test_files_dir():
     """Create and return a temporary directory for test files."""
-    test_dir = Path(__file__).parent / "test_files"
-    test_dir.mkdir(exist_ok=True)
-    yield test_dir
-    # Cleanup after tests
-    shutil.rmtree(test_dir)
+    TEST_FILES_DIR.mkdir(parents=True, exist_ok=True)
+    return TEST_FILES_DIR
+
+@dataclass(frozen=True)
+class TestFile:
+    """A test file path with its name parts computed once."""
+    __test__ = False  # Not a test class
+
+    path: str
+    basename: str
+    stem: str
+
+    @classmethod
+    def from_path(cls, path):
+        path = Path(path)
+        return cls(path=str(path), basename=path.name, stem=path.stem)
 
 @pytest.fixture
 def test_file_path(test_files_dir):
@@ -50,37 +124,60 @@ def test_file_path(test_files_dir):
     file_path = test_files_dir / unique_name
     with open(file_path, "w") as f:
         f.write("This is a test file for Langflow client integration tests.")
-    yield str(file_path)
+    yield TestFile.from_path(file_path)
     # File will be cleaned up when test_files_dir is cleaned
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_test_file_path(test_files_dir):
     """Create a large test file (5MB) for testing large file uploads."""
     file_path = test_files_dir / "large_test.bin"
     size_mb = 5
     with open(file_path, "wb") as f:
-        f.write(os.urandom(size_mb * 1024 * 1024))
-    yield str(file_path)
+        # Contents don't matter for upload tests; a sparse file of NULs is written instantly
+        f.seek(size_mb * 1024 * 1024 - 1)
+        f.write(b"\0")
+    yield TestFile.from_path(file_path)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def binary_test_file_path(test_files_dir):
     """Create a binary test file for testing binary file handling."""
     file_path = test_files_dir / "test.bin"
     with open(file_path, "wb") as f:
         f.write(bytes([0x89, 0x50, 0x4E, 0x47]))  # PNG magic number
-    yield str(file_path)
+    yield TestFile.from_path(file_path)
+
+def _safe_delete(client, file_id):
+    try:
+        client.files.delete(file_id)
+    except Exception:
+        pass  # Ignore errors during cleanup
+
+@pytest.fixture(scope="session")
+def session_file_ids():
+    """IDs of files owned by session fixtures, kept across per-test cleanup."""
+    return set()
+
+@pytest.fixture(scope="session")
+def uploaded_file(client, test_files_dir, session_file_ids):
+    """Upload one file for the whole session, for tests that just need a file to exist."""
+    file_path = test_files_dir / f"session_{uuid.uuid4().hex[:8]}.txt"
+    with open(file_path, "w") as f:
+        f.write("This is a test file for Langflow client integration tests.")
+    with open(file_path, "rb") as f:
+        uploaded = client.files.upload(f, filename=file_path.name)
+    session_file_ids.add(uploaded.id)
+    yield uploaded
+    session_file_ids.discard(uploaded.id)
+    _safe_delete(client, uploaded.id)
 
 @pytest.fixture(autouse=True)
-def cleanup_uploaded_files(client):
+def cleanup_uploaded_files(client, session_file_ids):
     """Automatically clean up any files uploaded during tests."""
     yield
     try:
-        # List all files and delete them
-        files = client.files.list()
-        for file in files:
-            try:
-                client.files.delete(file.id)
-            except Exception:
-                pass  # Ignore errors during cleanup
+        # List all files and delete them in one batch request
+        client.files.delete_many(
+            [f.id for f in client.files.iter() if f.id not in session_file_ids]
+        )
     except Exception:
-        pass  # Ignore list errors during cleanup 
\ No newline at end of file
+        pass  # Ignore errors during cleanup 
\ No newline at end of file
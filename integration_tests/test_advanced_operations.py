@@ -4,10 +4,8 @@ These tests cover scenarios like concurrent operations, large files,
 and error recovery.
 """
 import asyncio
-import concurrent.futures
-import os
 import pytest
-from langflow_client import LangflowError
+from langflow_client import LangflowError, LangflowRequestError
 
 
 def test_large_file_upload(client, large_test_file_path):
@@ -17,13 +15,12 @@ def test_large_file_upload(client, large_test_file_path):
     This demonstrates how the client handles large file uploads,
     which is important for real-world use cases.
     """
-    with open(large_test_file_path, "rb") as f:
-        response = client.files.upload(f, filename=os.path.basename(large_test_file_path))
+    with open(large_test_file_path.path, "rb") as f:
+        response = client.files.upload(f, filename=large_test_file_path.basename)
     
     assert response.id is not None
     # Server may modify filename, check base name without extension
-    base_name = os.path.splitext(os.path.basename(large_test_file_path))[0]
-    assert base_name in response.name
+    assert large_test_file_path.stem in response.name
 
 
 def test_binary_file_upload(client, binary_test_file_path):
@@ -33,20 +30,19 @@ def test_binary_file_upload(client, binary_test_file_path):
     This demonstrates how to handle binary file uploads,
     ensuring proper content-type handling.
     """
-    with open(binary_test_file_path, "rb") as f:
+    with open(binary_test_file_path.path, "rb") as f:
         response = client.files.upload(
             f,
-            filename=os.path.basename(binary_test_file_path),
+            filename=binary_test_file_path.basename,
             content_type="application/octet-stream"
         )
     
     assert response.id is not None
     # Server may modify filename, check base name without extension
-    base_name = os.path.splitext(os.path.basename(binary_test_file_path))[0]
-    assert base_name in response.name
+    assert binary_test_file_path.stem in response.name
 
 
-def test_concurrent_flow_runs(test_flow):
+def test_concurrent_flow_runs(test_flow, shared_executor):
     """
     Example: Running multiple flow operations concurrently.
     
@@ -65,17 +61,16 @@ def test_concurrent_flow_runs(test_flow):
         assert f"Your request is: {input_text}" in response.chat_output_text()
         return response
     
-    # Run flows concurrently using a thread pool
-    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-        futures = [executor.submit(run_flow, input_text) for input_text in inputs]
-        responses = [future.result() for future in futures]
+    # Run flows concurrently using the shared thread pool
+    futures = [shared_executor.submit(run_flow, input_text) for input_text in inputs]
+    responses = [future.result() for future in futures]
     
     assert len(responses) == len(inputs)
     for response, input_text in zip(responses, inputs):
         assert f"Your request is: {input_text}" in response.chat_output_text()
 
 
-def test_error_recovery(test_flow):
+def test_error_recovery(test_flow, bad_client):
     """
     Example: Handling and recovering from errors.
     
@@ -95,40 +90,26 @@ def test_error_recovery(test_flow):
     assert "Your request is: Recovery test" in response.chat_output_text()
     
     # Test recovery after network error simulation
-    try:
-        # Simulate network error with invalid URL
-        bad_client = LangflowClient({
-            "base_url": "http://invalid.example.com",
-            "api_key": "invalid"
-        })
+    # (bad_client targets a closed port, so the connection is refused instantly)
+    with pytest.raises(LangflowRequestError):
         bad_client.flow("invalid-id").run("test")
-    except Exception as e:
-        assert isinstance(e, (LangflowError, Exception))
     
     # Verify original client still works
     response = test_flow.run("Still working")
     assert "Your request is: Still working" in response.chat_output_text()
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("async_client")
 async def test_async_operations(test_flow):
     """
     Example: Running operations asynchronously.
     
     This demonstrates how to handle multiple operations
-    asynchronously using asyncio.
+    asynchronously using asyncio and the native async API.
     """
-    async def async_run_flow(input_text):
-        # Simulate async operation using ThreadPoolExecutor
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None, test_flow.run, input_text
-        )
-        return response
-    
-    # Run multiple flows concurrently
+    # Run multiple flows concurrently on the event loop
     inputs = ["Async 1", "Async 2", "Async 3"]
-    tasks = [async_run_flow(text) for text in inputs]
+    tasks = [test_flow.arun(text) for text in inputs]
     responses = await asyncio.gather(*tasks)
     
     assert len(responses) == len(inputs)
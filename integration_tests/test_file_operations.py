@@ -2,7 +2,6 @@
 Integration tests demonstrating Langflow client file operations.
 These tests serve as examples of how to use the file-related features.
 """
-import os
 from langflow_client import UserFile
 
 
@@ -14,35 +13,31 @@ def test_file_upload(client, test_file_path):
     in flows or stored for later use.
     """
     # Read file content
-    with open(test_file_path, "rb") as f:
+    with open(test_file_path.path, "rb") as f:
         # Upload file using the correct method signature
-        response = client.files.upload(f, filename=os.path.basename(test_file_path))
+        response = client.files.upload(f, filename=test_file_path.basename)
     
     assert isinstance(response, UserFile)
     # The server may modify the filename (e.g. add counter for duplicates)
     # so just check that the base name is contained in the response name
-    base_name = os.path.splitext(os.path.basename(test_file_path))[0]
-    assert base_name in response.name
+    assert test_file_path.stem in response.name
     assert response.id is not None
 
 
-def test_list_files(client, test_file_path):
+def test_list_files(client, uploaded_file):
     """
     Example: Listing uploaded files.
     
     This shows how to retrieve a list of all files that have
     been uploaded to Langflow.
     """
-    # First upload a file to ensure we have something to list
-    with open(test_file_path, "rb") as f:
-        client.files.upload(f, filename=os.path.basename(test_file_path))
-    
-    # List all files
+    # The session-scoped uploaded_file fixture ensures we have something to list
     files = client.files.list()
     
     assert isinstance(files, list)
     assert len(files) > 0
     assert all(isinstance(f, UserFile) for f in files)
+    assert any(f.id == uploaded_file.id for f in files)
 
 
 def test_file_lifecycle(client, test_file_path):
@@ -53,8 +48,8 @@ def test_file_lifecycle(client, test_file_path):
     upload -> list -> delete -> verify deletion
     """
     # Upload new file
-    with open(test_file_path, "rb") as f:
-        uploaded = client.files.upload(f, filename=os.path.basename(test_file_path))
+    with open(test_file_path.path, "rb") as f:
+        uploaded = client.files.upload(f, filename=test_file_path.basename)
     
     file_id = uploaded.id
     assert file_id is not None
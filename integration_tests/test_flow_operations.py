@@ -74,15 +74,13 @@ def test_flow_streaming(test_flow):
     test_input = "Generate a long response"
     stream = test_flow.stream(test_input)
     
-    # Collect all chunks
-    chunks = list(stream)
-    assert len(chunks) > 0
-    
-    # Each chunk should be a dict with expected structure
-    found_message = False
+    # Process chunks as they arrive, keeping only the text needed for assertions
+    chunk_count = 0
     full_content = []
     
-    for chunk in chunks:
+    for chunk in stream:
+        chunk_count += 1
+        # Each chunk should be a dict with expected structure
         assert isinstance(chunk, dict)
         assert "event" in chunk
         assert chunk["event"] in ["add_message", "end", "error"]
@@ -92,6 +90,10 @@ def test_flow_streaming(test_flow):
             # Extract text from message data
             if isinstance(data, dict) and "text" in data:
                 full_content.append(data["text"])
+        elif chunk["event"] == "end":
+            break
+    
+    assert chunk_count > 0
     
     # Join all content
     complete_content = " ".join(full_content)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import platform
 import sys
 from dataclasses import dataclass
@@ -7,16 +8,154 @@ from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
 from urllib.parse import urlencode, urljoin
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # optional, enables the async API (pip install langflow-client[async])
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:  # optional, faster JSON decoding (pip install langflow-client[speedups])
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from .errors import LangflowError, LangflowRequestError
 from .ndjson import iter_ndjson_objects
 
+# connection pool sizing for the session created when none is injected
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+# read size for streamed responses; events are still yielded per received chunk
+STREAM_CHUNK_SIZE = 8192
+# socket write size for request bodies read from file-like objects
+UPLOAD_BLOCKSIZE = 1024 * 1024
+
+_URLLIB3_MAJOR = int(urllib3.__version__.split(".")[0])
+
+
+def _default_retry(total: int) -> Retry:
+    # only idempotent methods are retried; the final response is returned as-is
+    # so non-OK statuses still surface as LangflowError
+    return Retry(
+        total=total,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+
+
+class _LargeBlockAdapter(HTTPAdapter):
+    """HTTPAdapter that sends file-like bodies in large blocks.
+
+    urllib3 reads readable bodies (e.g. the multipart upload encoder) in
+    ``blocksize`` pieces and writes each to the socket; the 16 KiB default
+    means hundreds of read/send round trips through Python per megabyte.
+    """
+
+    def init_poolmanager(self, *args, **pool_kwargs) -> None:
+        if _URLLIB3_MAJOR >= 2:  # blocksize is not accepted by urllib3 1.x
+            pool_kwargs.setdefault("blocksize", UPLOAD_BLOCKSIZE)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+
+def _create_session(max_retries: int) -> requests.Session:
+    session = requests.Session()
+    adapter = _LargeBlockAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=_default_retry(max_retries),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _require_httpx() -> None:
+    if httpx is None:
+        raise ImportError("HTTP/2 and the async API require httpx: pip install 'langflow-client[async]'")
+
+
+def _create_http2_session() -> "httpx.Client":
+    _require_httpx()
+    # concurrent requests from many threads multiplex over one HTTP/2 connection;
+    # servers without h2 are spoken to over HTTP/1.1 keep-alive instead
+    # timeout=None and follow_redirects=True match the requests transport
+    return httpx.Client(
+        http2=True,
+        limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+        timeout=None,
+        follow_redirects=True,
+    )
+
+
+def _create_async_session() -> "httpx.AsyncClient":
+    _require_httpx()
+    # timeout=None matches requests: calls without a timeout wait indefinitely
+    # instead of hitting httpx's 5 s default
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20),
+        timeout=None,
+    )
+
+
+def _decode_json(resp: Any) -> Any:
+    # injected response objects may not expose headers
+    headers = getattr(resp, "headers", None) or {}
+    if orjson is not None and "application/json" in headers.get("Content-Type", ""):
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+def _is_httpx(session: Any) -> bool:
+    return httpx is not None and isinstance(session, httpx.Client)
+
+
+def _is_sized_binary_stream(file_obj: Any) -> bool:
+    seekable = getattr(file_obj, "seekable", None)
+    try:
+        return callable(seekable) and seekable() and not isinstance(file_obj, io.TextIOBase)
+    except Exception:
+        return False
+
+
+def _httpx_file_field(value: Any) -> Any:
+    # httpx sizes file fields up front and rejects text mode, so pipes, read()-only
+    # and text objects are read into memory, as requests does for files=
+    if isinstance(value, tuple) and hasattr(value[1], "read") and not _is_sized_binary_stream(value[1]):
+        return (value[0], value[1].read(), *value[2:])
+    return value
+
+
+def _httpx_body(body: Any) -> Dict[str, Any]:
+    if body is None:
+        return {}
+    if isinstance(body, (str, bytes)):
+        return {"content": body}
+    if isinstance(body, dict):
+        return {"files": {key: _httpx_file_field(value) for key, value in body.items()}}
+    if hasattr(body, "read"):
+        # e.g. MultipartEncoder; httpx streams iterables but not file-like objects
+        return {"content": iter(lambda: body.read(UPLOAD_BLOCKSIZE), b"")}
+    return {"content": body}
+
 
 @dataclass
 class LangflowClientOptions:
     base_url: str
     api_key: Optional[str] = None
-    session: Optional[requests.Session] = None
+    # a requests.Session or an httpx.Client
+    session: Optional[requests.Session | "httpx.Client"] = None
+    http2: bool = False
+    # default for calls that don't pass their own timeout; None waits indefinitely
+    timeout: Optional[float | tuple] = None
+    # retries of idempotent requests; only applies to the requests.Session the
+    # client creates, and is ignored with http2=True or an injected session
+    max_retries: int = 3
+    async_session: Optional["httpx.AsyncClient"] = None
     default_headers: Optional[Mapping[str, str]] = None
 
 
@@ -31,7 +170,18 @@ class LangflowClient:
         self.base_url = opts.base_url
         self.base_path = "/api"
         self.api_key = opts.api_key
-        self.session = opts.session or requests.Session()
+        self.timeout = opts.timeout
+        # keep one pooled session so successive calls reuse keep-alive connections
+        self._owns_session = opts.session is None
+        if opts.session is not None:
+            self.session = opts.session
+        elif opts.http2:
+            self.session = _create_http2_session()
+        else:
+            self.session = _create_session(opts.max_retries)
+        # the async session is created on first use so httpx stays optional
+        self._owns_async_session = opts.async_session is None
+        self._async_session = opts.async_session
         self.default_headers: Dict[str, str] = dict(opts.default_headers or {})
 
         if "User-Agent" not in {k.title(): v for k, v in self.default_headers.items()}:
@@ -44,6 +194,34 @@ class LangflowClient:
         self.logs = Logs(self)
         self.files = Files(self)
 
+    def __enter__(self) -> "LangflowClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # an injected session belongs to the caller
+        if self._owns_session:
+            self.session.close()
+
+    async def __aenter__(self) -> "LangflowClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        if self._owns_async_session and self._async_session is not None:
+            await self._async_session.aclose()
+            self._async_session = None
+
+    @property
+    def async_session(self) -> "httpx.AsyncClient":
+        if self._async_session is None:
+            self._async_session = _create_async_session()
+        return self._async_session
+
     def _get_user_agent(self) -> str:
         try:
             from importlib.metadata import version
@@ -84,6 +262,50 @@ class LangflowClient:
 
         return Flow(self, flow_id, tweaks or {})
 
+    def _send(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: Optional[Any],
+        headers: Dict[str, str],
+        timeout: Optional[float | tuple],
+        stream: bool = False,
+    ) -> Any:
+        if timeout is None:
+            timeout = self.timeout
+        if _is_httpx(self.session):
+            # httpx treats timeout=None as "no timeout", so only override when given
+            extra = {} if timeout is None else {"timeout": timeout}
+            if hasattr(body, "read") and hasattr(body, "len"):
+                # a sized stream (e.g. MultipartEncoder) keeps its Content-Length, so only
+                # generator bodies such as Files.upload(chunk_size=...) go out chunked
+                headers = {**headers, "Content-Length": str(body.len)}
+            req = self.session.build_request(method, url, headers=headers, **_httpx_body(body), **extra)
+            resp = self.session.send(req, stream=stream)
+            if not resp.is_success:
+                resp.close()
+                raise LangflowError(f"{resp.status_code} - {resp.reason_phrase}", resp)
+            return resp
+
+        files = body if isinstance(body, dict) and any(
+            isinstance(v, tuple) for v in body.values()
+        ) else None
+        resp = self.session.request(
+            method,
+            url,
+            # str/bytes payloads and streaming bodies (e.g. MultipartEncoder)
+            data=body if files is None else None,
+            json=None,
+            headers=headers,
+            files=files,
+            stream=stream,
+            timeout=timeout,
+        )
+        if not resp.ok:
+            raise LangflowError(f"{resp.status_code} - {resp.reason}", resp)
+        return resp
+
     def request(
         self,
         *,
@@ -102,23 +324,50 @@ class LangflowClient:
         try:
             if hasattr(signal, "throw_if_aborted"):
                 signal.throw_if_aborted()
-            resp = self.session.request(
+            resp = self._send(method, url, body=body, headers=req_headers, timeout=timeout)
+            if hasattr(signal, "throw_if_aborted"):
+                signal.throw_if_aborted()
+            return _decode_json(resp)
+        except LangflowError:
+            raise
+        except Exception as error:  # transport-level
+            message = str(error)
+            raise LangflowRequestError(message, error)
+
+    async def arequest(
+        self,
+        *,
+        path: str,
+        method: str,
+        query: Optional[Mapping[str, str]] = None,
+        body: Optional[str | bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        signal: Optional[Any] = None,
+        timeout: Optional[float | tuple] = None,
+    ) -> Any:
+        url = self._set_url(path)
+        if query:
+            url = f"{url}?{urlencode(query)}"
+        req_headers = self._merge_headers(headers)
+        if timeout is None:
+            timeout = self.timeout
+        # httpx treats timeout=None as "no timeout", so only override when given
+        extra = {} if timeout is None else {"timeout": timeout}
+        try:
+            if hasattr(signal, "throw_if_aborted"):
+                signal.throw_if_aborted()
+            resp = await self.async_session.request(
                 method,
                 url,
-                data=body if isinstance(body, (str, bytes)) else None,
-                json=None,
+                content=body,
                 headers=req_headers,
-                files=body if isinstance(body, dict) and any(
-                    isinstance(v, tuple) for v in body.values()
-                )
-                else None,
-                timeout=timeout,
+                **extra,
             )
-            if not resp.ok:
-                raise LangflowError(f"{resp.status_code} - {resp.reason}", resp)
+            if not resp.is_success:
+                raise LangflowError(f"{resp.status_code} - {resp.reason_phrase}", resp)
             if hasattr(signal, "throw_if_aborted"):
                 signal.throw_if_aborted()
-            return resp.json()
+            return _decode_json(resp)
         except LangflowError:
             raise
         except Exception as error:  # transport-level
@@ -143,21 +392,26 @@ class LangflowClient:
         try:
             if hasattr(signal, "throw_if_aborted"):
                 signal.throw_if_aborted()
-            resp = self.session.request(
-                method,
-                url,
-                data=body if isinstance(body, (str, bytes)) else None,
-                headers=req_headers,
-                stream=True,
-                timeout=timeout,
+            resp = self._send(
+                method, url, body=body, headers=req_headers, timeout=timeout, stream=True
             )
-            if not resp.ok:
-                raise LangflowError(f"{resp.status_code} - {resp.reason}", resp)
-            # Iterate over lines and parse NDJSON
-            for obj in iter_ndjson_objects(resp.iter_lines(decode_unicode=True)):
-                if hasattr(signal, "throw_if_aborted"):
-                    signal.throw_if_aborted()
-                yield obj
+            try:
+                # Iterate over lines and parse NDJSON
+                if _is_httpx(self.session):
+                    lines = resp.iter_lines()
+                elif isinstance(resp, requests.Response):
+                    lines = resp.iter_lines(chunk_size=STREAM_CHUNK_SIZE, decode_unicode=True)
+                else:  # injected response objects only need iter_lines(decode_unicode=...)
+                    lines = resp.iter_lines(decode_unicode=True)
+                for obj in iter_ndjson_objects(lines):
+                    if hasattr(signal, "throw_if_aborted"):
+                        signal.throw_if_aborted()
+                    yield obj
+            finally:
+                # injected response objects are not required to have close()
+                close = getattr(resp, "close", None)
+                if close is not None:
+                    close()
         except LangflowError:
             raise
         except Exception as error:
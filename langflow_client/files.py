@@ -1,35 +1,107 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+from requests_toolbelt import MultipartEncoder
+
+from .client import _is_sized_binary_stream
+from .errors import LangflowError, LangflowRequestError
 from .user_file import UserFile
 
+# read-only: LangflowClient copies call headers into a fresh dict per request
+_JSON_HEADERS = MappingProxyType({"Accept": "application/json"})
+_JSON_BODY_HEADERS = MappingProxyType(
+    {"Accept": "application/json", "Content-Type": "application/json"}
+)
+
+DELETE_MANY_MAX_WORKERS = 8
+
+
+def _upload_filename(filename: Optional[str], file_obj) -> str:
+    if filename:
+        return filename
+    # never send the local directory layout; fdopen objects have an int name
+    name = getattr(file_obj, "name", None)
+    return os.path.basename(name) if isinstance(name, str) and name else "file"
+
+
+def _iter_chunks(stream, chunk_size: int) -> Iterator[bytes]:
+    while chunk := stream.read(chunk_size):
+        yield chunk
+
 
 class Files:
     def __init__(self, client):
         self.client = client
 
-    def upload(self, file_obj, *, filename: Optional[str] = None, content_type: Optional[str] = None, signal: Optional[Any] = None) -> UserFile:
-        files = {"file": (filename, file_obj, content_type or "application/octet-stream")}
-        headers = {"Accept": "application/json"}
+    def upload(
+        self,
+        file_obj,
+        *,
+        filename: Optional[str] = None,
+        content_type: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        signal: Optional[Any] = None,
+    ) -> UserFile:
+        """Upload a file to the v2 files API.
+
+        Args:
+            file_obj: File-like object to upload; seekable binary files are
+                streamed, anything else is encoded by the transport
+            filename: Name reported to the server
+            content_type: MIME type of the file
+            chunk_size: When set, send a streamed body with chunked transfer
+                encoding in pieces of this many bytes (1-4 MiB is a good range)
+            signal: Optional abort signal
+        """
+        field = (_upload_filename(filename, file_obj), file_obj, content_type or "application/octet-stream")
+        if _is_sized_binary_stream(file_obj):
+            # the encoder reads file_obj lazily, so the multipart body is never held in memory
+            try:
+                encoder = MultipartEncoder(fields={"file": field})
+            except Exception as error:
+                raise LangflowRequestError(str(error), error)
+            headers = {**_JSON_HEADERS, "Content-Type": encoder.content_type}
+            # a generator body has no length, so requests sends it chunked
+            body = _iter_chunks(encoder, chunk_size) if chunk_size else encoder
+        else:
+            # pipes, read()-only and text-mode objects: the encoder needs seek/tell
+            # and bytes, so let the transport build the multipart body
+            headers = _JSON_HEADERS
+            body = {"file": field}
         response = self.client.request(
             path="/v2/files",
             method="POST",
-            body=files,
+            body=body,
             headers=headers,
             signal=signal,
         )
         return UserFile(response)
 
-    def list(self, *, signal: Optional[Any] = None) -> List[UserFile]:
-        headers = {"Accept": "application/json"}
+    def iter(self, *, signal: Optional[Any] = None) -> Iterator[UserFile]:
+        """Lazily yield uploaded files.
+
+        The request is sent on first iteration and each `UserFile` is built
+        only when it is consumed.
+
+        Args:
+            signal: Optional abort signal
+        """
         response = self.client.request(
             path="/v2/files",
             method="GET",
-            headers=headers,
+            headers=_JSON_HEADERS,
             signal=signal,
         )
-        return [UserFile(item) for item in response]
+        for item in response:
+            yield UserFile(item)
+
+    def list(self, *, signal: Optional[Any] = None) -> List[UserFile]:
+        return list(self.iter(signal=signal))
 
     def delete(self, file_id: str, *, signal: Optional[Any] = None) -> None:
         """Delete a file by its ID.
@@ -38,10 +110,36 @@ class Files:
             file_id: The ID of the file to delete
             signal: Optional abort signal
         """
-        headers = {"Accept": "application/json"}
         self.client.request(
             path=f"/v2/files/{file_id}",
             method="DELETE",
-            headers=headers,
+            headers=_JSON_HEADERS,
             signal=signal,
-        ) 
\ No newline at end of file
+        )
+
+    def delete_many(self, file_ids: Iterable[str], *, signal: Optional[Any] = None) -> None:
+        """Delete several files, in one request when the server supports it.
+
+        Falls back to concurrent per-file deletes if the batch request gets
+        any error response.
+
+        Args:
+            file_ids: The IDs of the files to delete
+            signal: Optional abort signal
+        """
+        ids = [str(file_id) for file_id in file_ids]
+        if not ids:
+            return
+        try:
+            self.client.request(
+                path="/v2/files/batch/",
+                method="DELETE",
+                body=json.dumps(ids),
+                headers=_JSON_BODY_HEADERS,
+                signal=signal,
+            )
+            return
+        except LangflowError:
+            pass  # no usable batch endpoint; delete what we can one by one
+        with ThreadPoolExecutor(max_workers=min(DELETE_MANY_MAX_WORKERS, len(ids))) as executor:
+            list(executor.map(lambda file_id: self.delete(file_id, signal=signal), ids))
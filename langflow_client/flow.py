@@ -44,6 +44,34 @@ class Flow:
         )
         return FlowResponse(result)
 
+    async def arun(
+        self,
+        input_value: str,
+        *,
+        input_type: str = "chat",
+        output_type: str = "chat",
+        session_id: Optional[str] = None,
+        tweaks: Optional[Dict[str, Any]] = None,
+        signal: Optional[Any] = None,
+    ) -> FlowResponse:
+        final_tweaks = {**self.tweaks, **(tweaks or {})}
+        payload = {
+            "input_type": input_type,
+            "output_type": output_type,
+            "input_value": input_value,
+            "tweaks": final_tweaks,
+            "session_id": session_id,
+        }
+        headers = {"Content-Type": "application/json", "Accept": "application/json"}
+        result = await self.client.arequest(
+            path=f"/v1/run/{self.id}",
+            method="POST",
+            body=__import__("json").dumps(payload),
+            headers=headers,
+            signal=signal,
+        )
+        return FlowResponse(result)
+
     def stream(
         self,
         input_value: str,
@@ -7,14 +7,18 @@ from typing import Optional
 
 @dataclass
 class UserFile:
+    # no per-instance __dict__; field defaults would clash with the slots and
+    # are not needed since __init__ assigns every field
+    __slots__ = ("id", "name", "path", "size", "provider", "user_id", "created_at", "updated_at")
+
     id: str
     name: str
     path: str
     size: int
-    provider: Optional[str] = None
-    user_id: Optional[str] = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
+    provider: Optional[str]
+    user_id: Optional[str]
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
 
     def __init__(self, data: dict):
         self.id = data.get("id")
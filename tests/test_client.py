@@ -1,8 +1,11 @@
-from unittest.mock import MagicMock
+from io import BytesIO
+from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+import requests
 
-from langflow_client.client import LangflowClient
+from langflow_client.client import STREAM_CHUNK_SIZE, UPLOAD_BLOCKSIZE, LangflowClient
 from langflow_client.errors import LangflowError, LangflowRequestError
 from langflow_client.flow import Flow
 
@@ -64,4 +67,154 @@ def test_flow_factory():
     client = LangflowClient({"base_url": "http://localhost:1234"})
     flow = client.flow("flow-id")
     assert isinstance(flow, Flow)
-    assert flow.id == "flow-id" 
\ No newline at end of file
+    assert flow.id == "flow-id" 
+
+def test_default_session_uses_pooled_adapter():
+    client = LangflowClient({"base_url": "http://localhost:1234"})
+    for prefix in ("http://", "https://"):
+        adapter = client.session.get_adapter(prefix + "localhost")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+
+
+def test_context_manager_closes_owned_session_only():
+    with LangflowClient({"base_url": "http://localhost:1234"}) as client:
+        client.session = MagicMock()
+    client.session.close.assert_called_once()
+
+    session = MagicMock()
+    with LangflowClient({"base_url": "http://localhost:1234", "session": session}):
+        pass
+    session.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_arequest_error_status():
+    transport = httpx.MockTransport(lambda request: httpx.Response(401))
+    async with httpx.AsyncClient(transport=transport) as async_session:
+        client = LangflowClient({"base_url": "http://localhost:1234", "async_session": async_session})
+        with pytest.raises(LangflowError) as exc:
+            await client.arequest(path="/v1/run/flow-id", method="POST", headers={})
+    assert "401 - Unauthorized" in str(exc.value)
+
+
+@pytest.mark.asyncio
+async def test_arequest_transport_error():
+    def handler(request):
+        raise httpx.ConnectError("Connection refused")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as async_session:
+        client = LangflowClient({"base_url": "http://localhost:1234", "async_session": async_session})
+        with pytest.raises(LangflowRequestError):
+            await client.arequest(path="/v1/run/flow-id", method="POST", headers={})
+
+
+def test_default_session_sends_bodies_in_large_blocks():
+    client = LangflowClient({"base_url": "http://localhost:1234"})
+    adapter = client.session.get_adapter("http://localhost")
+    pool = adapter.poolmanager.connection_from_url("http://localhost:1234")
+    assert pool._new_conn().blocksize == UPLOAD_BLOCKSIZE
+
+
+def test_http2_option_uses_httpx_client():
+    client = LangflowClient({"base_url": "http://localhost:1234", "http2": True})
+    assert isinstance(client.session, httpx.Client)
+    client.close()
+    assert client.session.is_closed
+
+
+def test_httpx_session_request_and_stream():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        if request.url.params.get("stream") == "true":
+            return httpx.Response(200, content=b'{"event": "add_message"}\n{"event": "end"}\n')
+        return httpx.Response(200, json={"session_id": "sid", "outputs": []})
+
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    client = LangflowClient({"base_url": "http://localhost:1234", "api_key": "k", "session": session})
+
+    result = client.request(path="/v1/run/flow-id", method="POST", body="{}", headers={})
+    assert result["session_id"] == "sid"
+    assert seen[0].headers["x-api-key"] == "k"
+    assert seen[0].content == b"{}"
+
+    events = list(client.stream(path="/v1/run/flow-id", method="POST", body="{}", headers={}))
+    assert [e["event"] for e in events] == ["add_message", "end"]
+
+
+def test_httpx_session_error_status():
+    session = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(401)))
+    client = LangflowClient({"base_url": "http://localhost:1234", "session": session})
+    with pytest.raises(LangflowError) as exc:
+        client.request(path="/v1/run/flow-id", method="POST", headers={})
+    assert "401 - Unauthorized" in str(exc.value)
+
+
+def _json_client():
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[{"id": "a"}]))
+    return LangflowClient(
+        {"base_url": "http://localhost:1234", "session": httpx.Client(transport=transport)}
+    )
+
+
+def test_request_decodes_json_with_orjson(monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    import langflow_client.client as client_module
+
+    loads = MagicMock(wraps=orjson.loads)
+    monkeypatch.setattr(client_module.orjson, "loads", loads)
+    assert _json_client().request(path="/v2/files", method="GET") == [{"id": "a"}]
+    loads.assert_called_once()
+
+
+def test_request_decodes_json_without_orjson(monkeypatch):
+    import langflow_client.client as client_module
+
+    monkeypatch.setattr(client_module, "orjson", None)
+    assert _json_client().request(path="/v2/files", method="GET") == [{"id": "a"}]
+
+
+def test_client_timeout_is_default_for_requests():
+    session = MagicMock()
+    session.request.return_value = DummyResponse({})
+    client = LangflowClient({"base_url": "http://localhost:1234", "session": session, "timeout": 0.5})
+    client.request(path="/v1/run/flow-id", method="POST", headers={})
+    assert session.request.call_args.kwargs["timeout"] == 0.5
+    client.request(path="/v1/run/flow-id", method="POST", headers={}, timeout=3)
+    assert session.request.call_args.kwargs["timeout"] == 3
+
+
+def test_max_retries_option():
+    client = LangflowClient({"base_url": "http://localhost:1234", "max_retries": 0})
+    assert client.session.get_adapter("http://localhost").max_retries.total == 0
+
+
+@pytest.mark.asyncio
+async def test_default_async_session_has_no_timeout():
+    client = LangflowClient({"base_url": "http://localhost:1234"})
+    timeout = client.async_session.timeout
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (None, None, None, None)
+    await client.aclose()
+
+
+def test_stream_reads_requests_response_in_large_chunks():
+    resp = requests.Response()
+    resp.status_code = 200
+    resp.raw = BytesIO(b'{"event": "end"}\n')
+    session = MagicMock()
+    session.request.return_value = resp
+    client = LangflowClient({"base_url": "http://localhost:1234", "session": session})
+    with patch.object(requests.Response, "iter_lines", wraps=resp.iter_lines) as iter_lines:
+        events = list(client.stream(path="/v1/run/flow-id", method="POST", body="{}"))
+    assert events == [{"event": "end"}]
+    assert iter_lines.call_args.kwargs["chunk_size"] == STREAM_CHUNK_SIZE
+
+
+def test_http2_session_matches_requests_defaults():
+    client = LangflowClient({"base_url": "http://localhost:1234", "http2": True})
+    timeout = client.session.timeout
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (None, None, None, None)
+    assert client.session.follow_redirects is True
+    client.close()
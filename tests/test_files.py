@@ -1,6 +1,12 @@
+import json
+import os
 from io import BytesIO
 from unittest.mock import MagicMock
 
+import httpx
+import pytest
+from requests_toolbelt import MultipartEncoder
+
 from langflow_client.client import LangflowClient
 
 
@@ -40,6 +46,13 @@ def test_files_upload_file_object():
     assert args[0] == "POST"
     assert args[1].endswith("/api/v2/files")
     assert "files" in kwargs or True  # files passed via body param
+    assert isinstance(kwargs["data"], MultipartEncoder)
+    assert kwargs["headers"]["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert kwargs["files"] is None
+    body = kwargs["data"].to_string()
+    assert b'filename="image.jpg"' in body
+    assert b"Content-Type: image/jpeg" in body
+    assert b"abc" in body
     assert result.id == upload_response["id"]
 
 
@@ -61,4 +74,165 @@ def test_files_list():
     args, kwargs = session.request.call_args
     assert args[0] == "GET"
     assert args[1].endswith("/api/v2/files")
-    assert len(results) == 1 
\ No newline at end of file
+    assert len(results) == 1 
+
+def test_files_upload_chunked():
+    client, session = make_client(DummyResponse({"id": "id", "name": "big", "path": "p", "size": 10}))
+
+    client.files.upload(BytesIO(b"0123456789"), filename="big.bin", chunk_size=4)
+
+    _, kwargs = session.request.call_args
+    chunks = list(kwargs["data"])
+    assert all(len(c) <= 4 for c in chunks)
+    body = b"".join(chunks)
+    assert b'filename="big.bin"' in body
+    assert b"0123456789" in body
+    assert kwargs["headers"]["Content-Type"].startswith("multipart/form-data; boundary=")
+
+
+def test_files_iter_is_lazy():
+    client, session = make_client(DummyResponse([{"id": "a"}, {"id": "b"}]))
+
+    files = client.files.iter()
+    session.request.assert_not_called()
+
+    assert next(files).id == "a"
+    assert next(files).id == "b"
+    session.request.assert_called_once()
+
+
+def test_files_upload_over_httpx_session():
+    seen = []
+
+    def handler(request):
+        seen.append(request.read())
+        return httpx.Response(200, json={"id": "id", "name": "image", "path": "p", "size": 3})
+
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    client = LangflowClient({"base_url": "http://localhost:3000", "session": session})
+
+    result = client.files.upload(BytesIO(b"abc"), filename="image.jpg", content_type="image/jpeg")
+
+    assert result.id == "id"
+    assert b'filename="image.jpg"' in seen[0]
+    assert b"abc" in seen[0]
+
+
+def test_files_delete_many_batch():
+    client, session = make_client(DummyResponse({"message": "deleted"}))
+
+    client.files.delete_many(["a", "b"])
+
+    session.request.assert_called_once()
+    args, kwargs = session.request.call_args
+    assert args[0] == "DELETE"
+    assert args[1].endswith("/api/v2/files/batch/")
+    assert json.loads(kwargs["data"]) == ["a", "b"]
+
+
+@pytest.mark.parametrize("status", [400, 405, 500])
+def test_files_delete_many_falls_back_to_single_deletes(status):
+    client, session = make_client(None)
+    session.request.side_effect = lambda method, url, **kwargs: (
+        DummyResponse({}, ok=False, status=status, reason="Error")
+        if url.endswith("/batch/")
+        else DummyResponse({})
+    )
+
+    client.files.delete_many(["a", "b"])
+
+    urls = sorted(call.args[1] for call in session.request.call_args_list)
+    assert urls[0].endswith("/api/v2/files/a")
+    assert urls[1].endswith("/api/v2/files/b")
+    assert urls[2].endswith("/api/v2/files/batch/")
+
+
+def test_files_delete_many_empty_is_noop():
+    client, session = make_client(DummyResponse({}))
+    client.files.delete_many([])
+    session.request.assert_not_called()
+
+
+def test_files_upload_over_httpx_session_sends_content_length():
+    seen = []
+
+    def handler(request):
+        seen.append((request.headers, request.read()))
+        return httpx.Response(200, json={"id": "id", "name": "image", "path": "p", "size": 3})
+
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    client = LangflowClient({"base_url": "http://localhost:3000", "session": session})
+
+    client.files.upload(BytesIO(b"abc"), filename="image.jpg")
+    client.files.upload(BytesIO(b"abc"), filename="image.jpg", chunk_size=2)
+
+    (sized_headers, sized_body), (chunked_headers, _) = seen
+    assert sized_headers["Content-Length"] == str(len(sized_body))
+    assert "Transfer-Encoding" not in sized_headers
+    assert chunked_headers["Transfer-Encoding"] == "chunked"
+    assert "Content-Length" not in chunked_headers
+
+
+class ReadOnlyStream:
+    def __init__(self, data):
+        self._data = BytesIO(data)
+
+    def read(self, size=-1):
+        return self._data.read(size)
+
+
+def test_files_upload_non_seekable_stream():
+    client, session = make_client(DummyResponse({"id": "id", "name": "pipe", "path": "p", "size": 3}))
+    r, w = os.pipe()
+    os.write(w, b"abc")
+    os.close(w)
+    with os.fdopen(r, "rb") as pipe:
+        result = client.files.upload(pipe)
+
+    _, kwargs = session.request.call_args
+    name, file_obj, content_type = kwargs["files"]["file"]
+    assert name == "file"
+    assert file_obj is pipe
+    assert content_type == "application/octet-stream"
+    assert kwargs["data"] is None
+    assert result.id == "id"
+
+
+def test_files_upload_read_only_object():
+    client, session = make_client(DummyResponse({"id": "id", "name": "data", "path": "p", "size": 3}))
+    stream = ReadOnlyStream(b"abc")
+
+    client.files.upload(stream, filename="data.bin", chunk_size=2)
+
+    _, kwargs = session.request.call_args
+    assert kwargs["files"]["file"][:2] == ("data.bin", stream)
+    assert "Content-Type" not in kwargs["headers"]
+
+
+def test_files_upload_sends_basename_of_file_name(tmp_path):
+    client, session = make_client(DummyResponse({"id": "id", "name": "tf", "path": "p", "size": 3}))
+    path = tmp_path / "tf.txt"
+    path.write_bytes(b"abc")
+    with open(path, "rb") as f:
+        client.files.upload(f)
+        _, kwargs = session.request.call_args
+        body = kwargs["data"].to_string()
+
+    assert b'filename="tf.txt"' in body
+    assert str(tmp_path).encode() not in body
+
+
+def test_files_upload_non_seekable_stream_over_httpx_session():
+    seen = []
+
+    def handler(request):
+        seen.append(request.read())
+        return httpx.Response(200, json={"id": "id", "name": "data", "path": "p", "size": 3})
+
+    session = httpx.Client(transport=httpx.MockTransport(handler))
+    client = LangflowClient({"base_url": "http://localhost:3000", "session": session})
+
+    client.files.upload(ReadOnlyStream(b"abc"), filename="data.bin")
+
+    assert b'filename="data.bin"' in seen[0]
+    assert b"abc" in seen[0]
@@ -1,6 +1,10 @@
+import json
 from io import BytesIO
 from unittest.mock import MagicMock
 
+import httpx
+import pytest
+
 from langflow_client.client import LangflowClient
 from langflow_client.flow import Flow
 from langflow_client.flow_response import FlowResponse
@@ -70,6 +74,8 @@ def test_flow_stream_makes_streaming_request():
     stream = flow.stream("Hello")
     events = list(stream)
     assert len(events) == 3
+    _, kwargs = session.request.call_args
+    assert kwargs["stream"] is True
 
 
 def test_flow_upload_file():
@@ -77,4 +83,28 @@ def test_flow_upload_file():
     flow = Flow(client, "flow-id")
     result = flow.upload_file(BytesIO(b"abc"), filename="bodi.jpg", content_type="image/jpeg")
     assert isinstance(result, UploadResponse)
-    assert result.flow_id == "flow-id" 
\ No newline at end of file
+    assert result.flow_id == "flow-id" 
+
+@pytest.mark.asyncio
+async def test_flow_arun_posts_to_endpoint():
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json={"session_id": "sid", "outputs": []})
+
+    async_session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = LangflowClient(
+        {"base_url": "http://localhost:7860", "api_key": "k", "async_session": async_session}
+    )
+    flow = Flow(client, "flow-id")
+    result = await flow.arun("Hello")
+    await async_session.aclose()
+
+    assert isinstance(result, FlowResponse)
+    assert result.session_id == "sid"
+    (request,) = requests_seen
+    assert request.method == "POST"
+    assert request.url.path == "/api/v1/run/flow-id"
+    assert request.headers["x-api-key"] == "k"
+    assert json.loads(request.content)["input_value"] == "Hello"
@@ -15,4 +15,11 @@ def test_user_file_parses_dates():
 
     uf = UserFile(user_file_data)
     assert uf.created_at is not None
-    assert uf.updated_at is not None 
\ No newline at end of file
+    assert uf.updated_at is not None 
+
+def test_user_file_uses_slots():
+    uf = UserFile({"id": "id", "name": "bodi", "path": "p", "size": 1})
+    assert not hasattr(uf, "__dict__")
+    assert uf.provider is None
+    assert uf.created_at is None
+    assert uf == UserFile({"id": "id", "name": "bodi", "path": "p", "size": 1})